@@ -1,22 +1,329 @@
+import base64
 import json
 import os
-from typing import List
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Iterable, List, Literal, Optional, Tuple, Union
 
 import duckdb
+import google_crc32c
 import logfire
 import pandas as pd
-import pandas_gbq
-from google.cloud import bigquery, secretmanager, storage
+import pyarrow as pa
+import pyarrow.parquet as pq
+from google.auth.credentials import with_scopes_if_required
+from google.auth.transport.requests import AuthorizedSession
+from google.cloud import bigquery, bigquery_storage_v1, secretmanager, storage
+from google.cloud.bigquery_storage_v1 import types as storage_write_types
+from google.cloud.bigquery_storage_v1 import writer as storage_writer
+from google.cloud.storage import transfer_manager
 from google.oauth2 import service_account
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
 from loguru import logger
+from requests.adapters import HTTPAdapter
+
+__all__ = ["GoogleCloud"]
 
 logfire.configure()
 logger.configure(handlers=[logfire.loguru_handler()])
 
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+PARALLEL_UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+PARALLEL_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+UPLOAD_TIMEOUT = 300
+HASH_BUFFER_SIZE = 8 * 1024 * 1024
+# Rows appended through the Storage Write API are converted to protobuf one Python
+# object at a time (see `_proto_rows`), roughly 25 ms per 1,000 rows of 20 columns;
+# larger inputs are cheaper to ship as a Parquet load job.
+STREAMING_ROW_LIMIT = 100_000
+STREAMING_BATCH_ROWS = 10_000
+PARQUET_ROW_GROUP_SIZE = 256_000
+HTTP_POOL_SIZE = 32
+
+WRITE_DISPOSITIONS = {
+    "fail": bigquery.WriteDisposition.WRITE_EMPTY,
+    "replace": bigquery.WriteDisposition.WRITE_TRUNCATE,
+    "append": bigquery.WriteDisposition.WRITE_APPEND,
+}
+
+ARROW_TYPES = {
+    "STRING": pa.large_string(),
+    "INTEGER": pa.int64(),
+    "INT64": pa.int64(),
+    "FLOAT": pa.float64(),
+    "FLOAT64": pa.float64(),
+    "BOOLEAN": pa.bool_(),
+    "BOOL": pa.bool_(),
+    "DATE": pa.date32(),
+}
+
+
+@lru_cache(maxsize=8)
+def _load_credentials(
+    sa_json: str, mtime: Optional[float]
+) -> service_account.Credentials:
+    """
+    Parses Service Account credentials once per file version or JSON string.
+
+    Parameters:
+    sa_json (str): Path to the Service Account JSON file or the JSON content as a string.
+    mtime (Optional[float]): Modification time of the file, or None for JSON content.
+                            Part of the cache key, so an updated file is parsed again.
+
+    Returns:
+    google.oauth2.service_account.Credentials: The credentials object.
+    """
+    if mtime is not None:
+        return service_account.Credentials.from_service_account_file(sa_json)
+
+    return service_account.Credentials.from_service_account_info(json.loads(sa_json))
+
+
+def _crc32c_base64(file_path: str) -> str:
+    """
+    Computes the base64-encoded CRC32C of a file, the format GCS reports in `Blob.crc32c`.
+    Unlike MD5, GCS stores a CRC32C for every object, including multipart uploads.
+    """
+    checksum = google_crc32c.Checksum()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(HASH_BUFFER_SIZE):
+            checksum.update(chunk)
+
+    return base64.b64encode(checksum.digest()).decode("utf-8")
+
+
+def _bigquery_type(arrow_type: pa.DataType) -> str:
+    """Maps an Arrow type to the BigQuery type used for query parameters."""
+    if pa.types.is_integer(arrow_type):
+        return "INT64"
+    if pa.types.is_floating(arrow_type):
+        return "FLOAT64"
+    if pa.types.is_boolean(arrow_type):
+        return "BOOL"
+    if pa.types.is_date(arrow_type):
+        return "DATE"
+
+    return "STRING"
+
+
+def _conform_to_schema(table: pa.Table, schema: List[bigquery.SchemaField]) -> pa.Table:
+    """
+    Casts the columns of an Arrow Table to the Arrow equivalent of their BigQuery schema
+    type, so the Parquet file matches the declared schema. Columns that already match
+    (including dictionary-encoded ones) and types without a mapping are left untouched.
+
+    Parameters:
+    table (pa.Table): Table to be loaded.
+    schema (List[bigquery.SchemaField]): Declared BigQuery schema.
+
+    Returns:
+    pa.Table: The table with its columns cast where needed.
+    """
+    for field in schema:
+        target = ARROW_TYPES.get(field.field_type)
+        if target is None or field.name not in table.column_names:
+            continue
+
+        index = table.column_names.index(field.name)
+        current = table.schema.field(index).type
+        if pa.types.is_dictionary(current):
+            current = current.value_type
+        if current == target or (
+            pa.types.is_string(current) and pa.types.is_large_string(target)
+        ):
+            continue
+
+        table = table.set_column(index, field.name, table.column(index).cast(target))
+
+    return table
+
+
+def _align_to_schema(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """
+    Reorders and casts the columns of an Arrow Table to `schema`, so it can be written
+    with an open ParquetWriter.
+
+    Raises:
+    ValueError: If the table does not have exactly the columns of `schema`; columns are
+                never dropped or invented here.
+    """
+    missing = [name for name in schema.names if name not in table.column_names]
+    extra = [name for name in table.column_names if name not in schema.names]
+    if missing or extra:
+        raise ValueError(
+            f"Batch columns differ from the first batch. Missing: {missing}, extra: {extra}."
+        )
+
+    return table.select(schema.names).cast(schema)
+
+
+def _proto_field_type(arrow_type: pa.DataType) -> int:
+    """Maps an Arrow type to the protobuf field type the Storage Write API expects."""
+    field_type = descriptor_pb2.FieldDescriptorProto
+    if pa.types.is_int32(arrow_type) or pa.types.is_date(arrow_type):
+        return field_type.TYPE_INT32
+    if pa.types.is_integer(arrow_type):
+        return field_type.TYPE_INT64
+    if pa.types.is_floating(arrow_type):
+        return field_type.TYPE_DOUBLE
+    if pa.types.is_boolean(arrow_type):
+        return field_type.TYPE_BOOL
+
+    return field_type.TYPE_STRING
+
+
+def _proto_compatible(table: pa.Table) -> pa.Table:
+    """
+    Casts the columns of an Arrow Table to the values their protobuf fields carry:
+    DATE columns become days since the epoch and types without a protobuf
+    counterpart become strings. Dictionary-encoded columns are decoded.
+    """
+    for index, field in enumerate(table.schema):
+        value_type = (
+            field.type.value_type if pa.types.is_dictionary(field.type) else field.type
+        )
+        if pa.types.is_date(value_type):
+            target = pa.int32()
+        elif (
+            _proto_field_type(value_type)
+            == descriptor_pb2.FieldDescriptorProto.TYPE_STRING
+        ):
+            target = pa.large_string()
+        else:
+            target = value_type
+
+        if field.type != target:
+            column = table.column(index)
+            if pa.types.is_date(value_type):
+                column = column.cast(pa.date32())
+            table = table.set_column(index, field.name, column.cast(target))
+
+    return table
+
+
+def _proto_row_class(
+    schema: pa.Schema,
+) -> Tuple[descriptor_pb2.DescriptorProto, type]:
+    """
+    Builds a proto2 message descriptor with one optional field per column of `schema`,
+    numbered in column order, and the message class used to serialize rows with it.
+
+    Parameters:
+    schema (pa.Schema): Schema of the rows to send, as returned by `_proto_compatible`.
+
+    Returns:
+    Tuple[descriptor_pb2.DescriptorProto, type]: The descriptor and its message class.
+    """
+    proto_descriptor = descriptor_pb2.DescriptorProto(name="Row")
+    for number, field in enumerate(schema, start=1):
+        proto_descriptor.field.add(
+            name=field.name,
+            number=number,
+            type=_proto_field_type(field.type),
+            label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+        )
+
+    file_descriptor = descriptor_pb2.FileDescriptorProto(
+        name="row.proto", syntax="proto2"
+    )
+    file_descriptor.message_type.add().CopyFrom(proto_descriptor)
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_descriptor)
+
+    return proto_descriptor, message_factory.GetMessageClass(
+        pool.FindMessageTypeByName("Row")
+    )
+
+
+def _proto_rows(
+    batch: pa.RecordBatch, row_class: type
+) -> storage_write_types.ProtoRows:
+    """
+    Serializes the rows of a RecordBatch as protobuf messages; nulls are left unset.
+
+    Notes:
+    - Every row goes through a Python dict and message object, so the cost grows with
+      rows times columns; callers keep inputs under `STREAMING_ROW_LIMIT`. Arrow-format
+      appends would avoid it but are not supported by the pinned AppendRowsStream.
+    """
+    rows = storage_write_types.ProtoRows()
+    for record in batch.to_pylist():
+        row = row_class(**{k: v for k, v in record.items() if v is not None})
+        rows.serialized_rows.append(row.SerializeToString())
+
+    return rows
+
+
+@lru_cache(maxsize=64)
+def _delete_partitions_query(table: str, partition_columns: Tuple[str, ...]) -> str:
+    """
+    Builds the DELETE statement that clears the partitions present in a load.
+    The values are bound to the `@partitions` array parameter, so the text only
+    depends on the table and columns and is reused across calls.
+
+    Parameters:
+    table (str): Fully qualified table name (`project.dataset.table`).
+    partition_columns (Tuple[str, ...]): Columns identifying a partition.
+
+    Returns:
+    str: The parameterized DELETE statement.
+    """
+    if len(partition_columns) == 1:
+        return f"DELETE FROM `{table}` WHERE `{partition_columns[0]}` IN UNNEST(@partitions)"
+
+    columns = ", ".join(f"`{col}`" for col in partition_columns)
+    return f"DELETE FROM `{table}` WHERE STRUCT({columns}) IN UNNEST(@partitions)"
+
+
+def _partitions_parameter(
+    table: pa.Table, partition_columns: Tuple[str, ...]
+) -> bigquery.ArrayQueryParameter:
+    """
+    Builds the `@partitions` parameter with the distinct partition keys of a table:
+    scalar values for a single column, or one STRUCT per key combination otherwise.
+    """
+    types = {
+        col: _bigquery_type(table.schema.field(col).type) for col in partition_columns
+    }
+
+    if len(partition_columns) == 1:
+        col = partition_columns[0]
+        return bigquery.ArrayQueryParameter(
+            "partitions", types[col], table.column(col).unique().to_pylist()
+        )
+
+    columns = list(partition_columns)
+    keys = table.select(columns).group_by(columns).aggregate([]).to_pylist()
+    return bigquery.ArrayQueryParameter(
+        "partitions",
+        "STRUCT",
+        [
+            bigquery.StructQueryParameter(
+                None,
+                *[
+                    bigquery.ScalarQueryParameter(col, types[col], key[col])
+                    for col in partition_columns
+                ],
+            )
+            for key in keys
+        ],
+    )
+
+
+def _sql_literal(value: str) -> str:
+    """Quotes a value as a SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
 
 class GoogleCloud:
     def __init__(self) -> None:
         self.credentials = None
+        self.clients = {}
+        self.duckdb_connection = None
+        self.duckdb_key_id = None
 
     def authenticate(self, sa_json: str) -> service_account.Credentials:
         """
@@ -30,16 +337,10 @@ class GoogleCloud:
         """
         try:
             if os.path.exists(sa_json):
-                self.credentials = (
-                    service_account.Credentials.from_service_account_file(sa_json)
-                )
+                self.credentials = _load_credentials(sa_json, os.path.getmtime(sa_json))
                 logger.info("Authentication successful using service account file.")
             else:
-                self.credentials = (
-                    service_account.Credentials.from_service_account_info(
-                        json.loads(sa_json)
-                    )
-                )
+                self.credentials = _load_credentials(sa_json, None)
                 logger.info(
                     "Authentication successful using service account JSON content."
                 )
@@ -49,6 +350,105 @@ class GoogleCloud:
 
         return self.credentials
 
+    def _storage_client(
+        self, credentials: service_account.Credentials
+    ) -> storage.Client:
+        """
+        Returns a Cloud Storage client for the given credentials, creating it on first use.
+        The client and its connection pool are shared by every later call and worker thread.
+        """
+        key = ("storage", credentials)
+        if key not in self.clients:
+            self.clients[key] = storage.Client(credentials=credentials)
+
+        return self.clients[key]
+
+    def _bigquery_client(
+        self, credentials: service_account.Credentials, gcp_project: str
+    ) -> bigquery.Client:
+        """
+        Returns a BigQuery client for the given credentials and project, creating it on first use.
+        API calls go through an authorized session with a keep-alive pool of `HTTP_POOL_SIZE`
+        connections, shared by every later call on the client.
+        """
+        key = ("bigquery", credentials, gcp_project)
+        if key not in self.clients:
+            session = AuthorizedSession(
+                with_scopes_if_required(credentials, bigquery.Client.SCOPE)
+            )
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+            )
+            session.mount("https://", adapter)
+
+            self.clients[key] = bigquery.Client(
+                credentials=credentials, project=gcp_project, _http=session
+            )
+
+        return self.clients[key]
+
+    def _bigquery_write_client(
+        self, credentials: service_account.Credentials
+    ) -> bigquery_storage_v1.BigQueryWriteClient:
+        """
+        Returns a BigQuery Storage Write API client for the given credentials, creating it on first use.
+        """
+        key = ("bigquery_write", credentials)
+        if key not in self.clients:
+            self.clients[key] = bigquery_storage_v1.BigQueryWriteClient(
+                credentials=credentials
+            )
+
+        return self.clients[key]
+
+    def _append_with_storage_write(
+        self, table: pa.Table, table_id: str, gcp_project: str
+    ) -> None:
+        """
+        Appends an Arrow Table to an existing BigQuery table through the Storage Write API
+        default stream. Rows are sent as serialized protobuf messages over gRPC, described
+        by a descriptor built from the table schema.
+
+        Parameters:
+        table (pa.Table): Data to append; its columns must exist in the destination table.
+        table_id (str): Full table ID in the format `dataset.table`.
+        gcp_project (str): GCP Project ID.
+        """
+        write_client = self._bigquery_write_client(self.credentials)
+        dataset, table_name = table_id.split(".")
+        write_stream = f"{write_client.table_path(gcp_project, dataset, table_name)}/streams/_default"
+
+        table = _proto_compatible(table)
+        proto_descriptor, row_class = _proto_row_class(table.schema)
+
+        request_template = storage_write_types.AppendRowsRequest(
+            write_stream=write_stream,
+            proto_rows=storage_write_types.AppendRowsRequest.ProtoData(
+                writer_schema=storage_write_types.ProtoSchema(
+                    proto_descriptor=proto_descriptor
+                )
+            ),
+        )
+        append_stream = storage_writer.AppendRowsStream(write_client, request_template)
+
+        try:
+            futures = [
+                append_stream.send(
+                    storage_write_types.AppendRowsRequest(
+                        proto_rows=storage_write_types.AppendRowsRequest.ProtoData(
+                            rows=_proto_rows(batch, row_class)
+                        )
+                    )
+                )
+                for batch in table.to_batches(max_chunksize=STREAMING_BATCH_ROWS)
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            append_stream.close()
+
+        return
+
     def create_bucket_in_storage(
         self,
         bucket_name: str,
@@ -66,7 +466,7 @@ class GoogleCloud:
         storage_class (str): The storage class for the bucket (default: "STANDARD").
         """
         credentials = self.authenticate(sa_json)
-        client = storage.Client(credentials=credentials)
+        client = self._storage_client(credentials)
         bucket = client.bucket(bucket_name)
         bucket.storage_class = storage_class
 
@@ -78,21 +478,91 @@ class GoogleCloud:
 
         return None
 
+    def _upload_one(
+        self,
+        bucket: storage.Bucket,
+        local_path: str,
+        blob_name: str,
+        skip_unchanged: bool = False,
+    ) -> bool:
+        """
+        Uploads a single file to a bucket. Meant to run inside a worker thread:
+        the client is shared, but each call builds its own Blob object.
+        Files above `PARALLEL_UPLOAD_THRESHOLD` are split into chunks that are
+        uploaded concurrently; smaller ones use a single chunked upload.
+
+        Parameters:
+        bucket (storage.Bucket): Destination bucket.
+        local_path (str): Path of the local file.
+        blob_name (str): Name of the object in the bucket.
+        skip_unchanged (bool): Skip the upload when an object with the same size
+                               and CRC32C already exists (default: False).
+
+        Returns:
+        bool: True if the file was uploaded, False if it was skipped.
+        """
+        size = os.path.getsize(local_path)
+
+        if skip_unchanged:
+            remote_blob = bucket.get_blob(blob_name)
+            if (
+                remote_blob is not None
+                and remote_blob.crc32c is not None
+                and remote_blob.size == size
+                and remote_blob.crc32c == _crc32c_base64(local_path)
+            ):
+                return False
+
+        if size > PARALLEL_UPLOAD_THRESHOLD:
+            blob = bucket.blob(blob_name)
+            transfer_manager.upload_chunks_concurrently(
+                local_path,
+                blob,
+                chunk_size=PARALLEL_UPLOAD_CHUNK_SIZE,
+                worker_type=transfer_manager.THREAD,
+                max_workers=8,
+            )
+        else:
+            blob = bucket.blob(blob_name, chunk_size=UPLOAD_CHUNK_SIZE)
+            blob.upload_from_filename(local_path, timeout=UPLOAD_TIMEOUT)
+
+        return True
+
+    def _read_parquet_blob(self, bucket: storage.Bucket, blob_name: str) -> pa.Table:
+        """
+        Downloads a Parquet object into memory and decodes it as an Arrow Table.
+        Meant to run inside a worker thread.
+
+        Parameters:
+        bucket (storage.Bucket): Source bucket.
+        blob_name (str): Name of the Parquet object in the bucket.
+
+        Returns:
+        pa.Table: Contents of the Parquet object.
+        """
+        blob = bucket.blob(blob_name)
+        data = blob.download_as_bytes()
+
+        return pq.read_table(pa.BufferReader(data))
+
     def save_local_files_in_storage(
         self,
         filenames: List[str],
         source_directory: str,
         bucket_name: str,
         sa_json: str,
+        max_workers: int = 32,
     ) -> None:
         """
         Uploads files from a local directory to a specified Google Cloud Storage bucket.
+        Files are uploaded concurrently and removed locally once their upload succeeds.
 
         Parameters:
         filenames (List[str]): Names of files to upload.
         source_directory (str): Local directory containing the files.
         bucket_name (str): Name of the destination GCS bucket.
         sa_json (str): Path to the Service Account JSON file.
+        max_workers (int): Maximum number of concurrent uploads (default: 32).
 
         Raises:
         FileNotFoundError: If any file in the specified directory does not exist.
@@ -103,9 +573,10 @@ class GoogleCloud:
                 logger.error("Failed to authenticate. Cannot proceed.")
                 return
 
-            storage_client = storage.Client(credentials=self.credentials)
+            storage_client = self._storage_client(self.credentials)
             bucket = storage_client.bucket(bucket_name)
 
+            uploads = {}
             for filename in filenames:
                 local_path = os.path.join(source_directory, filename)
 
@@ -113,32 +584,67 @@ class GoogleCloud:
                     logger.error(f"File {local_path} does not exist. Skipping.")
                     continue
 
-                blob = bucket.blob(filename)
-                blob.upload_from_filename(local_path)
+                uploads[filename] = local_path
 
-                logger.info(f"Uploaded {filename} to bucket {bucket_name}.")
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    filename: executor.submit(
+                        self._upload_one, bucket, local_path, filename
+                    )
+                    for filename, local_path in uploads.items()
+                }
 
+            uploaded = []
+            uploaded_bytes = 0
+            for filename, future in futures.items():
                 try:
-                    os.remove(local_path)
-                    logger.info(f"Removed local file {filename} in {local_path}.")
+                    future.result()
+                    uploaded.append(uploads[filename])
+                    uploaded_bytes += os.path.getsize(uploads[filename])
+                    logger.debug("Uploaded {} to bucket {}.", filename, bucket_name)
                 except Exception as e:
-                    logger.error(
-                        f"Failed to remove local file {filename} in {local_path}: {e}"
-                    )
+                    logger.error(f"Failed to upload {filename}: {e}")
+
+            logger.info(
+                "Uploaded {} files ({:.1f} MiB) to bucket {} in {:.2f}s.",
+                len(uploaded),
+                uploaded_bytes / 1024**2,
+                bucket_name,
+                time.perf_counter() - start,
+            )
+
+            removed = 0
+            for local_path in uploaded:
+                try:
+                    os.unlink(local_path)
+                    removed += 1
+                except OSError as e:
+                    logger.error(f"Failed to remove local file {local_path}: {e}")
+            logger.info(f"Removed {removed} local files from {source_directory}.")
 
         except Exception as e:
             logger.error(f"Error uploading files: {e}")
 
     def save_files_in_storage(
-        self, file_paths: List[str], bucket_name: str, sa_json: str
+        self,
+        file_paths: List[str],
+        bucket_name: str,
+        sa_json: str,
+        max_workers: int = 32,
+        skip_unchanged: bool = True,
     ) -> None:
         """
         Uploads a list of files to a specified Google Cloud Storage bucket.
+        Files are uploaded concurrently, skipping the ones already stored with the same content.
 
         Parameters:
         file_paths (List[str]): List of file paths to be uploaded.
         bucket_name (str): The name of the GCS bucket.
         sa_json (str): Path to the Service Account JSON file for authentication.
+        max_workers (int): Maximum number of concurrent uploads (default: 32).
+        skip_unchanged (bool): Compare size and CRC32C with the existing object and skip
+                               identical files (default: True).
 
         Raises:
         FileNotFoundError: If any file in the specified directory does not exist.
@@ -149,89 +655,222 @@ class GoogleCloud:
                 logger.error("Failed to authenticate. Cannot proceed.")
                 return
 
-            storage_client = storage.Client(credentials=self.credentials)
+            storage_client = self._storage_client(self.credentials)
             bucket = storage_client.bucket(bucket_name)
 
+            uploads = {}
             for file_path in file_paths:
                 if not os.path.exists(file_path):
                     logger.error(f"File {file_path} does not exist. Skipping.")
                     continue
 
-                file_name = os.path.basename(file_path)
-                blob = bucket.blob(file_name)
-                blob.upload_from_filename(file_path)
+                uploads[os.path.basename(file_path)] = file_path
 
-                logger.info(f"Uploaded {file_name} to bucket {bucket_name}.")
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    file_name: executor.submit(
+                        self._upload_one, bucket, file_path, file_name, skip_unchanged
+                    )
+                    for file_name, file_path in uploads.items()
+                }
+
+            uploaded = skipped = 0
+            uploaded_bytes = 0
+            for file_name, future in futures.items():
+                try:
+                    if future.result():
+                        uploaded += 1
+                        uploaded_bytes += os.path.getsize(uploads[file_name])
+                        logger.debug(
+                            "Uploaded {} to bucket {}.", file_name, bucket_name
+                        )
+                    else:
+                        skipped += 1
+                        logger.debug("Skipping {}; checksum match.", file_name)
+                except Exception as e:
+                    logger.error(f"Failed to upload {file_name}: {e}")
+
+            logger.info(
+                "Uploaded {} files ({:.1f} MiB) to bucket {} in {:.2f}s; skipped {} unchanged.",
+                uploaded,
+                uploaded_bytes / 1024**2,
+                bucket_name,
+                time.perf_counter() - start,
+                skipped,
+            )
 
         except Exception as e:
             logger.error(f"Error uploading files to storage: {e}")
 
         return
 
+    def _duckdb_gcs_connection(
+        self, hmac_key_id: str, hmac_secret: str
+    ) -> duckdb.DuckDBPyConnection:
+        """
+        Returns a DuckDB connection able to scan `gs://` URIs through the httpfs extension.
+        The connection is created once per HMAC key and reused by later calls.
+
+        Parameters:
+        hmac_key_id (str): HMAC access key ID of the Service Account.
+        hmac_secret (str): HMAC secret of the Service Account.
+
+        Returns:
+        duckdb.DuckDBPyConnection: Connection with a GCS secret configured.
+        """
+        if self.duckdb_connection is None or self.duckdb_key_id != hmac_key_id:
+            connection = duckdb.connect()
+            connection.execute("INSTALL httpfs; LOAD httpfs;")
+            connection.execute(
+                f"CREATE SECRET (TYPE GCS, KEY_ID {_sql_literal(hmac_key_id)}, SECRET {_sql_literal(hmac_secret)})"
+            )
+            self.duckdb_connection = connection
+            self.duckdb_key_id = hmac_key_id
+            logger.info("DuckDB connection configured for GCS access.")
+
+        return self.duckdb_connection
+
     def read_parquet_files_in_storage(
-        self, file_names: List[str], bucket_name: str, sa_json: str
-    ) -> pd.DataFrame:
+        self,
+        file_names: List[str],
+        bucket_name: str,
+        sa_json: str,
+        hmac_key_id: Optional[str] = None,
+        hmac_secret: Optional[str] = None,
+        return_format: Literal["pandas", "arrow"] = "pandas",
+        max_workers: int = 32,
+    ) -> Union[pd.DataFrame, pa.Table]:
         """
         Reads multiple Parquet files from a GCS bucket using DuckDB.
 
+        When an HMAC key is given, DuckDB scans the objects directly from GCS with
+        its httpfs extension, so nothing is written to local disk and only the
+        required row groups and columns are fetched. Otherwise the files are
+        downloaded concurrently into memory and scanned by DuckDB as Arrow buffers.
+
         Parameters:
         file_names (List[str]): List of file names to read from the bucket.
         bucket_name (str): The name of the GCS bucket.
         sa_json (str): Path to the Service Account JSON file for authentication.
+        hmac_key_id (Optional[str]): HMAC access key ID for direct GCS scans (default: None).
+        hmac_secret (Optional[str]): HMAC secret for direct GCS scans (default: None).
+        return_format (Literal["pandas", "arrow"]): Result type (default: "pandas").
+                        "arrow" returns DuckDB's native Arrow output without converting it to pandas.
+        max_workers (int): Maximum number of concurrent downloads when no HMAC key is given (default: 32).
 
         Returns:
-        pd.DataFrame: DataFrame containing merged data from Parquet files.
-                    Returns an empty DataFrame in case of errors.
+        Union[pd.DataFrame, pa.Table]: Merged data from Parquet files.
+                    Returns an empty DataFrame (or Table) in case of errors.
         """
+        empty = pa.table({}) if return_format == "arrow" else pd.DataFrame()
         try:
+            if hmac_key_id and hmac_secret:
+                connection = self._duckdb_gcs_connection(hmac_key_id, hmac_secret)
+                uris = [f"gs://{bucket_name}/{file_name}" for file_name in file_names]
+
+                query = f"SELECT * FROM read_parquet([{', '.join(_sql_literal(uri) for uri in uris)}])"
+                logger.debug("Running DuckDB query: {}", query)
+                relation = connection.cursor().query(query)
+                data = relation.arrow() if return_format == "arrow" else relation.df()
+
+                logger.info("Successfully read Parquet files.")
+                return data
+
             self.credentials = self.authenticate(sa_json)
             if not self.credentials:
                 logger.error("Failed to authenticate. Cannot proceed.")
-                return pd.DataFrame()
+                return empty
 
-            storage_client = storage.Client(credentials=self.credentials)
+            storage_client = self._storage_client(self.credentials)
             bucket = storage_client.bucket(bucket_name)
 
-            temp_dir = "/tmp/parquet_files"
-            os.makedirs(temp_dir, exist_ok=True)
-
-            local_files = []
-            for file_name in file_names:
-                local_path = os.path.join(temp_dir, file_name)
-                blob = bucket.blob(file_name)
-                blob.download_to_filename(local_path)
-                local_files.append(local_path)
-                logger.info(f"Downloaded {file_name} to {local_path}.")
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                tables = list(
+                    executor.map(partial(self._read_parquet_blob, bucket), file_names)
+                )
+            logger.info(
+                "Downloaded {} files from bucket {} in {:.2f}s.",
+                len(tables),
+                bucket_name,
+                time.perf_counter() - start,
+            )
 
-            query = f"SELECT * FROM read_parquet({','.join([f'\'{file}\'' for file in local_files])})"
-            logger.info(f"Running DuckDB query: {query}")
-            df = duckdb.query(query).to_df()
+            connection = duckdb.connect()
+            for i, table in enumerate(tables):
+                connection.register(f"t{i}", table)
 
-            for file in local_files:
-                os.remove(file)
-                logger.info(f"Removed temporary file {file}.")
+            query = " UNION ALL BY NAME ".join(
+                f"SELECT * FROM t{i}" for i in range(len(tables))
+            )
+            logger.debug("Running DuckDB query: {}", query)
+            relation = connection.query(query)
+            data = relation.arrow() if return_format == "arrow" else relation.df()
+            connection.close()
 
-            logger.info("Successfully read Parquet files into a DataFrame.")
-            return df
+            logger.info("Successfully read Parquet files.")
+            return data
 
         except Exception as e:
             logger.error(f"Error reading Parquet files: {e}")
-            return pd.DataFrame()
+            return empty
+
+    def _delete_partitions(
+        self,
+        client: bigquery.Client,
+        table_name: str,
+        partition_keys: pa.Table,
+        partition_columns: Tuple[str, ...],
+    ) -> None:
+        """
+        Deletes the rows of `table_name` whose partition keys appear in `partition_keys`,
+        with the cached DELETE statement and the keys bound as the `@partitions` parameter.
+        Nothing is deleted when there are no keys.
+        """
+        if partition_keys.num_rows == 0:
+            logger.info(f"No partitions to delete from {table_name}.")
+            return
+
+        delete_query = _delete_partitions_query(table_name, partition_columns)
+        partitions = _partitions_parameter(partition_keys, partition_columns)
+
+        logger.info(
+            f"Deleting existing data from {table_name} for {len(partitions.values)} partitions of {partition_columns}."
+        )
+        delete_job = client.query(
+            delete_query,
+            job_config=bigquery.QueryJobConfig(query_parameters=[partitions]),
+        )
+        delete_job.result()
+        logger.info(f"Deleted {delete_job.num_dml_affected_rows} rows.")
+
+        return
 
     def insert_dataframe_into_bigquery(
         self,
-        df: pd.DataFrame,
+        df: Union[pd.DataFrame, pa.Table, Iterable[pa.RecordBatch]],
         table_id: str,
         sa_json: str,
         partition_columns: List[str],
         gcp_project: str,
         if_exists: str = "append",
+        streaming: bool = False,
+        staging_bucket: Optional[str] = None,
+        schema: Optional[List[bigquery.SchemaField]] = None,
     ) -> None:
         """
         Inserts a DataFrame into a BigQuery table with optional partition-based deletion.
+        Data is written to a temporary ZSTD-compressed, dictionary-encoded Parquet file and
+        ingested with a BigQuery load job.
+        With `streaming`, appends of up to `STREAMING_ROW_LIMIT` rows to an existing table
+        go through the Storage Write API instead. With `staging_bucket`, the Parquet file is
+        staged in GCS and loaded from its URI, keeping large uploads out of the load request.
 
         Parameters:
-        df (pd.DataFrame): DataFrame to insert.
+        df (Union[pd.DataFrame, pa.Table, Iterable[pa.RecordBatch]]): DataFrame, Arrow Table
+                        or iterable of Arrow RecordBatches to insert. Batches are written to
+                        the Parquet file as they arrive, so only one is held in memory.
         table_id (str): Full table ID in the format `dataset.table`.
         sa_json (str): Path to the Service Account JSON file.
         partition_columns (List[str]): Column names for partition deletion (e.g., ["column1", "column2"]).
@@ -240,13 +879,37 @@ class GoogleCloud:
                         - "fail": Raise an error.
                         - "replace": Overwrite the table.
                         - "append": Append to the table (default).
+        streaming (bool): Use the Storage Write API for small appends (default: False).
+                        Only applies to DataFrames and Tables. Rows written this way cannot
+                        be changed by DML (including the partition deletion above) while
+                        they are in the streaming buffer.
+        staging_bucket (Optional[str]): GCS bucket used to stage the Parquet file for
+                        the load job; the staged object is deleted afterwards (default: None).
+        schema (Optional[List[bigquery.SchemaField]]): Explicit table schema. The data is
+                        cast to it before serialization. It is given to the load job (with
+                        autodetection disabled) only when the table is created or replaced;
+                        appends keep the existing table schema, of which the data may carry
+                        a subset of columns. Inferred from the data when None (default: None).
 
         Raises:
         Exception: If an error occurs during insertion.
+
+        Notes:
+        - The partitions present in the data are deleted only once the whole Parquet file
+          has been written, right before the load job runs.
+        - Every batch must carry the columns of the first one (in any order); otherwise the
+          insertion fails before any partition is deleted or data is loaded.
         """
         try:
+            if isinstance(df, pd.DataFrame):
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            elif isinstance(df, pa.Table):
+                table = df
+            else:
+                table = None
+
             self.credentials = self.authenticate(sa_json)
-            client = bigquery.Client(credentials=self.credentials, project=gcp_project)
+            client = self._bigquery_client(self.credentials, gcp_project)
 
             table_ref = client.dataset(table_id.split(".")[0]).table(
                 table_id.split(".")[1]
@@ -259,32 +922,129 @@ class GoogleCloud:
                 table_exists = False
                 logger.info(f"Table `{table_id}` does not exist. It will be created.")
 
-            if table_exists and partition_columns:
-                delete_conditions = " AND ".join(
-                    [
-                        f"{col} IN ({', '.join([f'\'{value}\'' for value in df[col].unique()])})"
-                        for col in partition_columns
-                    ]
-                )
-                delete_query = (
-                    f"DELETE FROM `{gcp_project}.{table_id}` WHERE {delete_conditions}"
-                )
+            partition_columns = (
+                tuple(partition_columns) if table_exists and partition_columns else ()
+            )
+
+            if (
+                streaming
+                and table is not None
+                and table_exists
+                and if_exists == "append"
+                and table.num_rows <= STREAMING_ROW_LIMIT
+            ):
+                if schema:
+                    table = _conform_to_schema(table, schema)
+                if partition_columns:
+                    self._delete_partitions(
+                        client, f"{gcp_project}.{table_id}", table, partition_columns
+                    )
 
                 logger.info(
-                    f"Deleting existing data from {gcp_project}.{table_id} for partitions: {delete_conditions}."
+                    f"Streaming data into {gcp_project}.{table_id} with the Storage Write API."
                 )
-                pandas_gbq.read_gbq(delete_query, project_id=gcp_project)
-
-            logger.info(f"Inserting data into {gcp_project}.{table_id}.")
-            pandas_gbq.to_gbq(
-                df,
-                destination_table=table_id,
-                project_id=gcp_project,
-                if_exists=if_exists,
+                self._append_with_storage_write(table, table_id, gcp_project)
+                logger.info(
+                    f"Inserted data into {gcp_project}.{table_id} successfully. Rows: {table.num_rows}, Columns: {table.num_columns}."
+                )
+                return
+
+            job_config = bigquery.LoadJobConfig(
+                source_format=bigquery.SourceFormat.PARQUET,
+                write_disposition=WRITE_DISPOSITIONS[if_exists],
+            )
+            if schema and (not table_exists or if_exists == "replace"):
+                job_config.schema = schema
+                job_config.autodetect = False
+
+            chunks = (
+                [table]
+                if table is not None
+                else (pa.Table.from_batches([batch]) for batch in df)
             )
 
+            with tempfile.TemporaryFile() as buffer:
+                writer = None
+                partition_keys = []
+                pending = []
+                pending_rows = 0
+                num_rows = 0
+
+                for chunk in chunks:
+                    if schema:
+                        chunk = _conform_to_schema(chunk, schema)
+                    if writer is None:
+                        writer = pq.ParquetWriter(
+                            buffer,
+                            chunk.schema,
+                            compression="zstd",
+                            use_dictionary=True,
+                        )
+                    elif chunk.schema != writer.schema:
+                        chunk = _align_to_schema(chunk, writer.schema)
+
+                    # Each write_table call closes its own row group, so batches are
+                    # buffered until they fill one.
+                    pending.append(chunk)
+                    pending_rows += chunk.num_rows
+                    if pending_rows >= PARQUET_ROW_GROUP_SIZE:
+                        writer.write_table(
+                            pa.concat_tables(pending),
+                            row_group_size=PARQUET_ROW_GROUP_SIZE,
+                        )
+                        pending, pending_rows = [], 0
+                    num_rows += chunk.num_rows
+                    if partition_columns:
+                        partition_keys.append(
+                            chunk.select(list(partition_columns))
+                            .group_by(list(partition_columns))
+                            .aggregate([])
+                        )
+
+                if writer is None:
+                    logger.warning(f"No data to insert into {gcp_project}.{table_id}.")
+                    return
+
+                if pending:
+                    writer.write_table(
+                        pa.concat_tables(pending), row_group_size=PARQUET_ROW_GROUP_SIZE
+                    )
+                writer.close()
+                buffer.seek(0)
+
+                if partition_keys:
+                    self._delete_partitions(
+                        client,
+                        f"{gcp_project}.{table_id}",
+                        pa.concat_tables(partition_keys),
+                        partition_columns,
+                    )
+
+                if staging_bucket:
+                    storage_client = self._storage_client(self.credentials)
+                    staging_blob = storage_client.bucket(staging_bucket).blob(
+                        f"staging/{table_id}/{uuid.uuid4().hex}.parquet"
+                    )
+                    staging_blob.upload_from_file(buffer, timeout=UPLOAD_TIMEOUT)
+                    staging_uri = f"gs://{staging_bucket}/{staging_blob.name}"
+
+                    logger.info(
+                        f"Inserting data into {gcp_project}.{table_id} from {staging_uri}."
+                    )
+                    try:
+                        client.load_table_from_uri(
+                            staging_uri, table_ref, job_config=job_config
+                        ).result()
+                    finally:
+                        staging_blob.delete()
+                else:
+                    logger.info(f"Inserting data into {gcp_project}.{table_id}.")
+                    client.load_table_from_file(
+                        buffer, table_ref, job_config=job_config
+                    ).result()
+
             logger.info(
-                f"Inserted data into {gcp_project}.{table_id} successfully. Rows: {df.shape[0]}, Columns: {df.shape[1]}."
+                f"Inserted data into {gcp_project}.{table_id} successfully. Rows: {num_rows}, Columns: {len(writer.schema)}."
             )
 
         except Exception as e:
@@ -1,25 +1,352 @@
+import asyncio
+import ftplib
 import glob
 import os
-import urllib.error
-import urllib.request
-from multiprocessing import Pool
-from typing import List, Tuple
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Union
 
+import aioftp
 import logfire
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from loguru import logger
+from pysus.data.local import ParquetSet
+from pysus.ftp import CACHEPATH
 from pysus.ftp.databases.sih import SIH
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 logger.configure(handlers=[logfire.loguru_handler()])
 
+FTP_HOST = "ftp.datasus.gov.br"
+RD_REMOTE_DIRECTORY = "/dissemin/publicos/SIHSUS/200801_/Dados"
+DBC_DIRECTORY = "./data/dbc"
+FTP_BLOCK_SIZE = 1024 * 1024
+FILE_BUFFER_SIZE = 4 * 1024 * 1024
+SIH_INDEX_TTL_SECONDS = 6 * 60 * 60
+RECORD_BATCH_ROWS = 64_000
+INTEGER_COLUMNS = ("CODMUNRES", "SEXO")
+FTP_TIMEOUT = 60
+FTP_TRANSIENT_ERRORS = (
+    ftplib.error_temp,
+    ftplib.error_reply,
+    socket.timeout,
+    ConnectionError,
+    EOFError,
+)
+
+_ftp_sessions = threading.local()
+
+
+def _get_ftp_session() -> ftplib.FTP:
+    """
+    Returns the calling thread's persistent FTP session, logging in only when
+    the thread has no live connection yet. Each thread keeps its own session,
+    so concurrent callers never share a control connection. Socket operations
+    time out after `FTP_TIMEOUT` seconds instead of blocking on a stalled server.
+    """
+    session = getattr(_ftp_sessions, "session", None)
+
+    if session is not None:
+        try:
+            session.voidcmd("NOOP")
+            return session
+        except ftplib.all_errors:
+            session.close()
+
+    session = ftplib.FTP(FTP_HOST, timeout=FTP_TIMEOUT)
+    session.login()
+    _ftp_sessions.session = session
+    logger.info(f"Opened FTP session with {FTP_HOST}.")
+
+    return session
+
+
+@retry(
+    stop=stop_after_attempt(4),
+    wait=wait_exponential(multiplier=0.5, max=8),
+    retry=retry_if_exception_type(FTP_TRANSIENT_ERRORS),
+    reraise=True,
+)
+def _retrieve_file(remote_path: str, file_path: str) -> None:
+    """
+    Retrieves one file over the calling thread's FTP session, retrying transient
+    failures with exponential backoff. The session is discarded after a transient
+    failure, so the retry logs in again on a fresh connection. Local file errors
+    are not retried.
+
+    Parameters:
+    remote_path (str): Path of the file on the FTP server.
+    file_path (str): Local destination path.
+    """
+    with open(file_path, "wb", buffering=FILE_BUFFER_SIZE) as f:
+        session = _get_ftp_session()
+        try:
+            session.retrbinary(f"RETR {remote_path}", f.write, blocksize=FTP_BLOCK_SIZE)
+        except FTP_TRANSIENT_ERRORS:
+            session.close()
+            _ftp_sessions.session = None
+            raise
+
+    return
+
+
+async def _download_RD_reports_worker(queue: asyncio.Queue) -> None:
+    """
+    Drains the download queue over a single FTP connection, so the control
+    connection and login are reused for every file this worker retrieves.
+    Local file writes run in a thread pool (`aioftp.AsyncPathIO`) and never
+    block the event loop.
+
+    Parameters:
+    queue (asyncio.Queue): Queue of pysus files returned by `SIH.get_files`.
+    """
+    async with aioftp.Client.context(
+        FTP_HOST, path_io_factory=aioftp.AsyncPathIO, socket_timeout=FTP_TIMEOUT
+    ) as client:
+        while not queue.empty():
+            file = queue.get_nowait()
+            file_name = file.basename
+
+            try:
+                await client.download(
+                    file.path,
+                    os.path.join(DBC_DIRECTORY, file_name),
+                    write_into=True,
+                    block_size=FTP_BLOCK_SIZE,
+                )
+                logger.info(f"Successfully downloaded {file_name}")
+            except Exception as e:
+                logger.error(f"Download error {file_name}: {e}")
+
+    return
+
+
+async def _download_RD_reports(files: list, max_connections: int) -> None:
+    """
+    Downloads RD reports concurrently over at most `max_connections` FTP connections.
+
+    Parameters:
+    files (list): pysus files returned by `SIH.get_files`.
+    max_connections (int): Maximum number of simultaneous FTP connections.
+    """
+    queue = asyncio.Queue()
+    for file in files:
+        queue.put_nowait(file)
+
+    workers = [
+        _download_RD_reports_worker(queue)
+        for _ in range(min(max_connections, len(files)))
+    ]
+    results = await asyncio.gather(*workers, return_exceptions=True)
+
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"FTP connection error: {result}")
+
+    return
+
+
+def _parse_RD_report_types(table: pa.Table) -> pa.Table:
+    """
+    Applies the value cleanup pysus' `ParquetSet.to_dataframe` performs (`parse_dftypes`),
+    so reading its Parquet output directly loads the same values:
+    - Whitespace-only values become empty strings.
+    - `INTEGER_COLUMNS` values that are digits once spaces are removed are written as
+      integers, without the spaces and leading zeros.
+
+    Parameters:
+    table (pa.Table): Report read from the pysus Parquet output.
+
+    Returns:
+    pa.Table: The table with its string columns cleaned.
+    """
+    for index, field in enumerate(table.schema):
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            continue
+
+        column = table.column(index)
+        if field.name in INTEGER_COLUMNS:
+            digits = pc.replace_substring(column, " ", "")
+            is_integer = pc.ascii_is_decimal(digits)
+            integers = pc.if_else(is_integer, digits, pa.scalar("0", field.type))
+            integers = pc.cast(pc.cast(integers, pa.int64()), field.type)
+            column = pc.if_else(is_integer, integers, column)
+
+        column = pc.if_else(pc.utf8_is_space(column), pa.scalar("", field.type), column)
+        table = table.set_column(index, field.name, column)
+
+    return table
+
+
+def _prepare_RD_report(file) -> Optional[str]:
+    """
+    Downloads one RD report and converts it to Parquet, without reading it.
+    The DBC file is retrieved over the calling thread's own FTP session, since pysus'
+    `File.download` shares (and closes) one process-wide connection. Meant to run
+    inside a worker thread.
+
+    Parameters:
+    file: pysus file returned by `SIH.get_files`.
+
+    Returns:
+    Optional[str]: Path of the Parquet output, or None if it could not be produced.
+
+    Notes:
+    - Files are cached in the pysus cache directory; a report already converted to
+      DBF or Parquet there is not downloaded again.
+    """
+    try:
+        logger.info(f"Processing file: {file}")
+        dbc_path = os.path.join(CACHEPATH, file.basename)
+        name = os.path.splitext(dbc_path)[0]
+
+        if not os.path.exists(f"{name}.parquet") and not os.path.exists(f"{name}.dbf"):
+            os.makedirs(CACHEPATH, exist_ok=True)
+            try:
+                _retrieve_file(file.path, dbc_path)
+            except Exception:
+                if os.path.exists(dbc_path):
+                    os.remove(dbc_path)
+                raise
+
+        return ParquetSet(dbc_path).path
+    except Exception as e:
+        logger.error(f"Error preparing {file}: {e}")
+        return None
+
+
+def _read_RD_report_parquet(
+    parquet_path: str, columns: Optional[List[str]] = None
+) -> pa.Table:
+    """
+    Reads the Parquet output of one RD report as an Arrow Table. The data is memory-mapped
+    rather than copied through buffered reads, then cleaned the way pysus cleans it for
+    DataFrames. Requested columns the report does not carry are skipped.
+    """
+    if columns is not None:
+        available = pq.ParquetDataset(parquet_path).schema.names
+        columns = [name for name in columns if name in available]
+
+    table = pq.read_table(
+        parquet_path,
+        columns=columns,
+        memory_map=True,
+        pre_buffer=True,
+        use_threads=True,
+    )
+
+    return _parse_RD_report_types(table)
+
+
+def _read_RD_report(file, columns: Optional[List[str]] = None) -> Optional[pa.Table]:
+    """
+    Downloads one RD report, converting it to Parquet, and reads it as an Arrow Table.
+    Meant to run inside a worker thread.
+
+    Parameters:
+    file: pysus file returned by `SIH.get_files`.
+    columns (Optional[List[str]]): Columns to read; all columns when None.
+
+    Returns:
+    Optional[pa.Table]: The report contents, or None if it could not be processed.
+    """
+    parquet_path = _prepare_RD_report(file)
+    if parquet_path is None:
+        return None
+
+    try:
+        table = _read_RD_report_parquet(parquet_path, columns)
+        logger.info(f"Successfully processed {file}")
+        return table
+    except Exception as e:
+        logger.error(f"Error reading {file}: {e}")
+        return None
+
+
+def _RD_report_schema(
+    parquet_paths: List[str], columns: Optional[List[str]] = None
+) -> pa.Schema:
+    """
+    Unifies the schemas of several RD report Parquet outputs from their footers, so
+    columns that only some reports (e.g. newer SIH layouts) carry are kept.
+
+    Parameters:
+    parquet_paths (List[str]): Parquet outputs of the reports.
+    columns (Optional[List[str]]): Columns to keep; all columns when None.
+
+    Returns:
+    pa.Schema: The union of the report schemas.
+    """
+    schemas = []
+    for parquet_path in parquet_paths:
+        schema = pq.ParquetDataset(parquet_path).schema
+        if columns is not None:
+            schema = pa.schema([field for field in schema if field.name in columns])
+        schemas.append(schema.remove_metadata())
+
+    return pa.unify_schemas(schemas)
+
+
+def _align_RD_report(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """
+    Orders the columns of a report as in `schema`, filling the columns the report does
+    not carry with nulls.
+    """
+    return pa.Table.from_arrays(
+        [
+            (
+                table.column(field.name).cast(field.type)
+                if field.name in table.column_names
+                else pa.nulls(table.num_rows, field.type)
+            )
+            for field in schema
+        ],
+        schema=schema,
+    )
+
 
 class SIHController:
+    _sih_singleton: Optional[SIH] = None
+    _sih_loaded_at: float = 0.0
+    _sih_lock = threading.RLock()
+
     def __init__(self, uf, year, month, params):
         self.uf = uf
         self.year = year
         self.month = month
         self.params = params
 
+    @classmethod
+    def _get_sih(cls) -> SIH:
+        """
+        Returns the loaded SIH database, listing the DataSUS FTP directory only on first use.
+        The instance is shared by every call in the process and reloaded once it is older
+        than `SIH_INDEX_TTL_SECONDS`, so newly published months become visible.
+        """
+        with cls._sih_lock:
+            expired = time.monotonic() - cls._sih_loaded_at > SIH_INDEX_TTL_SECONDS
+            if cls._sih_singleton is None or expired:
+                cls._sih_singleton = SIH().load()
+                cls._sih_loaded_at = time.monotonic()
+                logger.info("Loaded SIH file index from DataSUS FTP.")
+
+        return cls._sih_singleton
+
     def request_one_RD_report_dbc_format(uf: str, year: str, month: str) -> None:
         """
         Downloads a single RD report file in DBC format for a specific state, year, and month from the SIH-SUS FTP server.
@@ -32,107 +359,259 @@ class SIHController:
         Saves:
         A `.dbc` file to the local directory `./data/dbc/` under the name `RD<uf><year><month>.dbc`.
 
+        Details:
+        - Reuses the calling thread's persistent FTP session instead of logging in for every file,
+          so it can be driven from a thread pool.
+        - Streams 1 MiB blocks through a 4 MiB write buffer.
+        - Probes the file with an FTP `SIZE` command first and skips it when DataSUS has not
+          published it. Transient FTP failures are retried up to 4 times with exponential backoff.
+
         Raises:
-        urllib.error.URLError: If there is a URL-related error during download.
+        ftplib.Error: If there is an FTP-related error during download.
         Exception: For any other unexpected error.
         """
-        url = f"ftp://ftp.datasus.gov.br/dissemin/publicos/SIHSUS/200801_/Dados/RD{uf}{year}{month}.dbc"
-        file_path = f"./data/dbc/RD{uf}{year}{month}.dbc"
+        file_name = f"RD{uf}{year}{month}.dbc"
+        remote_path = f"{RD_REMOTE_DIRECTORY}/{file_name}"
+        file_path = os.path.join(DBC_DIRECTORY, file_name)
 
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        os.makedirs(DBC_DIRECTORY, exist_ok=True)
 
         try:
-            urllib.request.urlretrieve(url, file_path)
-            logger.info(f"Successfully downloaded RD{uf}{year}{month}.dbc")
+            session = _get_ftp_session()
+            session.voidcmd("TYPE I")
+            try:
+                session.size(remote_path)
+            except ftplib.error_perm:
+                logger.warning(f"File not found, skipping download: {remote_path}")
+                return
 
-        except urllib.error.URLError as e:
-            logger.error(f"Download error {url}: {e}")
+            _retrieve_file(remote_path, file_path)
+            logger.info(f"Successfully downloaded {file_name}")
+
+        except ftplib.all_errors as e:
+            logger.error(f"Download error {remote_path}: {e}")
+            if os.path.exists(file_path):
+                os.remove(file_path)
 
         except Exception as e:
-            logger.error(f"Download error {url}: {e}")
+            logger.error(f"Download error {remote_path}: {e}")
 
         return
 
     def request_multiple_RD_reports_dbc_format(
-        params: List[Tuple[str, str, str]]
+        uf: Union[str, List[str]],
+        year: Union[str, List[str]],
+        month: Union[str, List[str]],
+        max_connections: int = 16,
     ) -> None:
         """
-        Downloads multiple RD report files in DBC format using parallel processing.
+        Downloads multiple RD report files in DBC format using concurrent FTP connections.
 
         Parameters:
-        params (List[Tuple[str, str, str]]):
-            A list of tuples where each tuple contains:
-            - A two-letter Brazilian state code (e.g., 'SP' for São Paulo).
-            - A two-digit year as a string (e.g., '24').
-            - A two-digit month as a string (e.g., '01' for January).
+        uf (Union[str, List[str]]): Two-letter Brazilian state codes (e.g., ['SP', 'RJ']).
+        year (Union[str, List[str]]): Two-digit years (e.g., ['24']).
+        month (Union[str, List[str]]): Two-digit months (e.g., ['01', '02']).
+        max_connections (int): Maximum number of simultaneous FTP connections (default: 16).
 
         Details:
-        - Uses parallel processing with a pool size of 8 for concurrent downloads.
-        - Calls `request_one_RD_report_dbc_format` internally for each tuple.
-
-        Raises:
-        Exception: If any error occurs during parallel processing.
+        - Every state/year/month combination is resolved in a single `pysus` `get_files`
+          call against the cached SIH index; combinations DataSUS has not published are
+          skipped instead of failing one download each.
+        - Downloads run on an asyncio event loop; each connection logs in once and
+          retrieves files from a shared queue until it is empty. Disk writes are
+          handed to a thread pool so they overlap with network transfers.
+        - The event loop is uvloop when it is installed, falling back to asyncio's default loop.
+        - Failed files are logged and do not interrupt the remaining downloads.
+        - `request_one_RD_report_dbc_format` remains available as a synchronous fallback.
         """
-        with Pool(8) as pool:
-            pool.starmap(SIHController.request_one_RD_report_dbc_format, params)
+        try:
+            files = SIHController._get_sih().get_files(
+                "RD", uf=uf, year=year, month=month
+            )
+            if not files:
+                logger.warning("No files found for the specified parameters.")
+                return
+        except Exception as e:
+            logger.error(f"Error fetching file list for RD reports: {e}")
+            return
+
+        os.makedirs(DBC_DIRECTORY, exist_ok=True)
+        asyncio.run(
+            _download_RD_reports(files, max_connections),
+            loop_factory=uvloop.new_event_loop if uvloop else None,
+        )
 
         return
 
-    def request_RD_report_dataframe_format(
-        uf: str, year: str, month: str
-    ) -> pd.DataFrame:
+    def request_RD_report_arrow_format(
+        uf: Union[str, List[str]],
+        year: Union[str, List[str]],
+        month: Union[str, List[str]],
+        max_workers: int = 16,
+        columns: Optional[List[str]] = None,
+    ) -> pa.Table:
         """
-        Downloads and processes RD report files into a combined DataFrame.
+        Downloads and processes RD report files into a combined Arrow Table.
 
         Parameters:
-        uf (str): Two-letter Brazilian state code (e.g., 'SP' for São Paulo).
-        year (str): Two-digit year (e.g., '24') indicating the year of the report.
-        month (str): Two-digit month (e.g., '01' for January).
+        uf (Union[str, List[str]]): Two-letter Brazilian state codes (e.g., ['SP', 'RJ']).
+        year (Union[str, List[str]]): Two-digit years (e.g., ['24']).
+        month (Union[str, List[str]]): Two-digit months (e.g., ['01']).
+        max_workers (int): Maximum number of files downloaded and converted at once (default: 16).
+        columns (Optional[List[str]]): Columns to read from each report; all columns when None.
 
         Returns:
-        pd.DataFrame:
-            A combined DataFrame of all processed RD reports for the specified state, year, and month.
-            Returns an empty DataFrame if no files are available or an error occurs.
-
-        Raises:
-        Exception: For errors during file fetching, processing, or DataFrame combination.
+        pa.Table:
+            A combined Table of all processed RD reports for the specified state, year, and month.
+            Returns an empty Table if no files are available or an error occurs.
 
         Notes:
-        - The method relies on the `pysus` library to access SIH-SUS FTP servers.
-        - Files are downloaded and converted to Parquet before loading into DataFrames.
+        - The method relies on the `pysus` library to access SIH-SUS FTP servers; all
+          state/year/month combinations are resolved in one `get_files` call.
+        - Files are downloaded and converted to Parquet concurrently (up to `max_workers` threads),
+          read as Arrow tables into a list pre-sized to the file count, and concatenated
+          without copying in the order `get_files` returned them.
+        - Only the requested `columns` are decoded from each Parquet file.
         """
-        sih = SIH().load()
+        sih = SIHController._get_sih()
 
         try:
             files = sih.get_files("RD", uf=uf, year=year, month=month)
             if not files:
                 logger.warning("No files found for the specified parameters.")
-                return pd.DataFrame()
+                return pa.table({})
         except Exception as e:
             logger.error(f"Error fetching file list for RD reports: {e}")
-            return pd.DataFrame()
+            return pa.table({})
 
-        dataframes = []
+        tables = [None] * len(files)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+            futures = {
+                executor.submit(_read_RD_report, file, columns): index
+                for index, file in enumerate(files)
+            }
+            for future in as_completed(futures):
+                tables[futures[future]] = future.result()
 
-        for file in files:
-            try:
-                logger.info(f"Processing file: {file}")
-                parquet_file = sih.download([file])
+        tables = [table for table in tables if table is not None]
 
-                df = parquet_file.to_dataframe()
-                dataframes.append(df)
-                logger.info(f"Successfully processed {file}")
+        if tables:
+            try:
+                if len(tables) == 1:
+                    combined_table = tables[0]
+                else:
+                    combined_table = pa.concat_tables(tables, promote_options="default")
+                logger.info("Successfully combined all tables.")
+                return combined_table
             except Exception as e:
-                logger.error(f"Error reading {file}: {e}")
+                logger.error(f"Error combining tables: {e}")
+                return pa.table({})
+        else:
+            logger.warning("No tables were successfully processed.")
+            return pa.table({})
+
+    def iter_RD_report_batches(
+        uf: Union[str, List[str]],
+        year: Union[str, List[str]],
+        month: Union[str, List[str]],
+        max_workers: int = 16,
+        columns: Optional[List[str]] = None,
+        batch_size: int = RECORD_BATCH_ROWS,
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Downloads and processes RD report files, yielding their rows as Arrow RecordBatches.
+
+        Parameters:
+        uf (Union[str, List[str]]): Two-letter Brazilian state codes (e.g., ['SP', 'RJ']).
+        year (Union[str, List[str]]): Two-digit years (e.g., ['24']).
+        month (Union[str, List[str]]): Two-digit months (e.g., ['01']).
+        max_workers (int): Maximum number of files downloaded and converted at once (default: 16).
+        columns (Optional[List[str]]): Columns to read from each report; all columns when None.
+        batch_size (int): Maximum number of rows per RecordBatch (default: 64,000).
+
+        Returns:
+        Iterator[pa.RecordBatch]:
+            Batches of every processed RD report, file by file in the order `get_files`
+            returned them. Yields nothing if no files are available or an error occurs.
+
+        Notes:
+        - All files are downloaded and converted to Parquet on disk first (up to `max_workers`
+          at once). Their footers give the union of their columns, which every batch carries;
+          reports without a column get nulls in it, as `pd.concat` did.
+        - Unlike `request_RD_report_arrow_format`, only one report is held in memory at a time.
+        - Files that fail to download, convert or read are logged and skipped. If the report
+          schemas cannot be unified, the error is logged and nothing is yielded.
+        """
+        sih = SIHController._get_sih()
 
-        if dataframes:
+        try:
+            files = sih.get_files("RD", uf=uf, year=year, month=month)
+            if not files:
+                logger.warning("No files found for the specified parameters.")
+                return
+        except Exception as e:
+            logger.error(f"Error fetching file list for RD reports: {e}")
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+            parquet_paths = [
+                parquet_path
+                for parquet_path in executor.map(_prepare_RD_report, files)
+                if parquet_path is not None
+            ]
+
+        if not parquet_paths:
+            logger.warning("No tables were successfully processed.")
+            return
+
+        try:
+            schema = _RD_report_schema(parquet_paths, columns)
+        except Exception as e:
+            logger.error(f"Error unifying the schemas of the RD reports: {e}")
+            return
+
+        for parquet_path in parquet_paths:
             try:
-                combined_df = pd.concat(dataframes, ignore_index=True)
-                logger.info("Successfully combined all DataFrames.")
-                return combined_df
+                table = _read_RD_report_parquet(parquet_path, columns)
+                table = _align_RD_report(table, schema)
             except Exception as e:
-                logger.error(f"Error combining DataFrames: {e}")
-                return pd.DataFrame()
-        else:
-            logger.warning("No DataFrames were successfully processed.")
-            return pd.DataFrame()
+                logger.error(f"Error reading {parquet_path}: {e}")
+                continue
+            logger.info(f"Successfully processed {parquet_path}")
+            yield from table.to_batches(max_chunksize=batch_size)
+
+        return
+
+    def request_RD_report_dataframe_format(
+        uf: Union[str, List[str]],
+        year: Union[str, List[str]],
+        month: Union[str, List[str]],
+        max_workers: int = 16,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Downloads and processes RD report files into a combined DataFrame.
+
+        Parameters:
+        uf (Union[str, List[str]]): Two-letter Brazilian state codes (e.g., ['SP', 'RJ']).
+        year (Union[str, List[str]]): Two-digit years (e.g., ['24']).
+        month (Union[str, List[str]]): Two-digit months (e.g., ['01']).
+        max_workers (int): Maximum number of files downloaded and converted at once (default: 16).
+        columns (Optional[List[str]]): Columns to read from each report; all columns when None.
+
+        Returns:
+        pd.DataFrame:
+            A combined DataFrame of all processed RD reports for the specified state, year, and month.
+            Returns an empty DataFrame if no files are available or an error occurs.
+
+        Notes:
+        - Wraps `request_RD_report_arrow_format`; the combined Table is converted to pandas
+          once, with Arrow-backed dtypes and its buffers released as columns are converted.
+        """
+        table = SIHController.request_RD_report_arrow_format(
+            uf, year, month, max_workers, columns
+        )
+
+        return table.to_pandas(
+            self_destruct=True, split_blocks=True, types_mapper=pd.ArrowDtype
+        )
@@ -1,8 +1,12 @@
 import os
 from datetime import datetime
+from itertools import chain
+from typing import Iterable, Iterator, Optional
 
 import logfire
+import pyarrow as pa
 from dateutil.relativedelta import relativedelta
+from google.cloud import bigquery
 from loguru import logger
 
 from classes import GoogleCloud, SIHController
@@ -17,6 +21,36 @@ from classes import GoogleCloud, SIHController
 
 logger.configure(handlers=[logfire.loguru_handler()])
 
+_GCLOUD: Optional[GoogleCloud] = None
+
+
+def _gcloud() -> GoogleCloud:
+    """
+    Returns the process-wide GoogleCloud instance, creating it on first use.
+    Warm invocations reuse its cached credentials and clients.
+    """
+    global _GCLOUD
+    _GCLOUD = _GCLOUD or GoogleCloud()
+
+    return _GCLOUD
+
+
+def _with_date_loading(
+    batches: Iterable[pa.RecordBatch], date_loading: str
+) -> Iterator[pa.RecordBatch]:
+    """
+    Appends the `date_loading` column to every batch, as a dictionary array whose
+    single entry all rows point to.
+    """
+    dictionary = pa.array([date_loading], pa.large_string())
+
+    for batch in batches:
+        indices = pa.repeat(pa.scalar(0, pa.int8()), batch.num_rows)
+        yield pa.RecordBatch.from_arrays(
+            batch.columns + [pa.DictionaryArray.from_arrays(indices, dictionary)],
+            names=batch.schema.names + ["date_loading"],
+        )
+
 
 def main(request):
     logger.info("Starting the extraction of DataSUS SIH RD.")
@@ -25,10 +59,12 @@ def main(request):
     uf = data_request.get("uf")
     year = data_request.get("year")
     month = data_request.get("month")
+    columns = data_request.get("columns")
 
     gcp_project = data_request.get("gcp_project")
     table_id = data_request.get("table_id")
     partition_columns = data_request.get("partition_columns")
+    staging_bucket = data_request.get("staging_bucket")
 
     # sa_json = "config/service_account.json"
     secret_project_id = os.getenv("secret_project_id")
@@ -43,21 +79,41 @@ def main(request):
         current_month = last_month_date.strftime("%m")
         month = [current_month]
 
+    if columns:
+        columns = list(dict.fromkeys(columns + (partition_columns or [])))
+    else:
+        columns = None
+
     # Request report
-    df = SIHController.request_RD_report_dataframe_format(uf, year, month)
+    batches = SIHController.iter_RD_report_batches(uf, year, month, columns=columns)
+    first_batch = next(batches, None)
+    if first_batch is None:
+        logger.warning("No RD report data found for the requested parameters.")
+        return {"status": "success", "message": "No data to extract."}, 200
 
     # Get secret value (JSON Service Account)
-    google_cloud = GoogleCloud()
+    google_cloud = _gcloud()
     sa_json = google_cloud.access_secret_from_secret_manager(
         secret_project_id, secret_id
     )
 
     # Insert data in BigQuery
-    df = df.astype(str)
-    df["date_loading"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    schema = [
+        bigquery.SchemaField(name, "STRING")
+        for name in first_batch.schema.names + ["date_loading"]
+    ]
 
     google_cloud.insert_dataframe_into_bigquery(
-        df, table_id, sa_json, partition_columns, gcp_project
+        _with_date_loading(
+            chain([first_batch], batches),
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        ),
+        table_id,
+        sa_json,
+        partition_columns,
+        gcp_project,
+        staging_bucket=staging_bucket,
+        schema=schema,
     )
 
     logger.info("Extraction of DataSUS SIH RD completed successfully.")
@@ -76,6 +132,7 @@ class Request:
             "uf": ["RJ", "SP", "MG", "ES"],
             "year": ["24"],
             "month": ["10"],
+            "columns": [],
         }
         return parameters
 
@@ -1,16 +1,33 @@
 import os
 from datetime import datetime
 
-import pandas as pd
+import pyarrow as pa
+from google.cloud import bigquery
+from pyarrow import csv as pacsv
 
 from classes import GoogleCloud
 
 # secret_project_id = os.getenv("secret_project_id")
 # secret_id = os.getenv("secret_id")
 
-df = pd.read_csv("./data/csv_lookup/lookup_municipality.csv", index_col=False)
-df = df.astype(str)
-df["date_loading"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+csv_path = "./data/csv_lookup/lookup_municipality.csv"
+read_options = pacsv.ReadOptions(use_threads=True, block_size=1 << 22)
+headers = pacsv.open_csv(csv_path, read_options=read_options).schema.names
+
+table = pacsv.read_csv(
+    csv_path,
+    read_options=read_options,
+    convert_options=pacsv.ConvertOptions(
+        column_types={name: pa.large_string() for name in headers}
+    ),
+)
+table = table.append_column(
+    "date_loading",
+    pa.DictionaryArray.from_arrays(
+        pa.repeat(pa.scalar(0, pa.int8()), table.num_rows),
+        pa.array([datetime.now().strftime("%Y-%m-%d %H:%M:%S")], pa.large_string()),
+    ),
+)
 
 google_cloud = GoogleCloud()
 
@@ -18,10 +35,11 @@ sa_json = "config/service_account.json"
 # sa_json = google_cloud.access_secret_from_secret_manager(secret_project_id, secret_id)
 
 google_cloud.insert_dataframe_into_bigquery(
-    df,
+    table,
     table_id="lookup.tb_lookup_municipality",
     sa_json=sa_json,
     partition_columns="",
     gcp_project="datasus-prod",
     if_exists="replace",
+    schema=[bigquery.SchemaField(name, "STRING") for name in table.column_names],
 )